@@ -3,48 +3,319 @@
 
 import re
 import json
+import mmap
 import os
-from collections import defaultdict
+import sys
+import functools
+import hashlib
+import pickle
+
+# Snapshot of the derived lookup structures (tries, sorted affix lists)
+# so repeated short-lived runs skip rebuilding them
+_DERIVED_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'hindi_morph', 'v1.pkl'
+)
+
+# orjson parses/serializes JSON several times faster than the stdlib;
+# fall back silently so the analyzer still has no hard dependencies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled extraction kernels (see setup.py); the pure-Python trie walks
+# below are used when the extension hasn't been built
+try:
+    import hindi_morph_core as _core
+except ImportError:
+    _core = None
+
+
+# Files at least this large are memory-mapped rather than copied into a
+# bytes object before parsing
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+def _read_json(file_path):
+    """Parse a JSON file, using orjson when available"""
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # orjson parses straight out of the page cache via the
+            # buffer protocol; no intermediate bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return orjson.loads(memoryview(mm))
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json(obj, file_path):
+    """Write obj as indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+class AnalysisResult:
+    """
+    Morphological analysis of a single word
+
+    Slotted instances are cheaper to build than a fresh 8-key dict in the
+    per-token hot path; dict-style access ([], get, in) is kept so
+    existing callers and the exception entries (plain dicts) stay
+    interchangeable. Use as_dict() at JSON serialization boundaries.
+    """
+    __slots__ = ('original', 'root', 'root_info', 'suffix', 'suffix_features',
+                 'prefix', 'prefix_features', 'sandhi_applied')
+
+    def __init__(self, original, root, root_info, suffix, suffix_features,
+                 prefix, prefix_features, sandhi_applied):
+        self.original = original
+        self.root = root
+        self.root_info = root_info
+        self.suffix = suffix
+        self.suffix_features = suffix_features
+        self.prefix = prefix
+        self.prefix_features = prefix_features
+        self.sandhi_applied = sandhi_applied
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def as_dict(self):
+        """Plain-dict view for JSON serialization"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f'AnalysisResult({self.as_dict()!r})'
+
+
+def results_to_dicts(results):
+    """Convert a list of analysis results to plain dicts for JSON output"""
+    return [
+        result.as_dict() if isinstance(result, AnalysisResult) else result
+        for result in results
+    ]
+
 
 class HindiMorphAnalyzer:
-    def __init__(self, rules_path=None, dictionary_path=None):
+    # Strips punctuation in a single C loop over codepoints
+    _PUNCT_TABLE = str.maketrans('', '', '।,;.!?()[]{}:"\'-')
+
+    # Matches a run of non-space, non-punctuation characters; one findall
+    # replaces the split + per-word cleaning cycle for batch input
+    _TOKEN_RE = re.compile(r'[^\s।,;.!?()[\]{}:"\'-]+')
+
+    # Shared sentinels for the miss paths; plain dicts so results stay
+    # JSON-serializable, treat them as read-only
+    _UNKNOWN_ROOT_INFO = {'category': 'unknown', 'meaning': 'unknown'}
+    _EMPTY_FEATURES = {}
+
+    def __init__(self, rules_path=None, dictionary_path=None,
+                 rules=None, dictionary=None):
         """
         Initialize the Hindi Morphology Analyzer
-        
+
         Args:
             rules_path: Path to morphological rules file
             dictionary_path: Path to Hindi dictionary/lexicon
+            rules: Already-parsed rules data; takes precedence over
+                rules_path so callers can cache the JSON parse themselves
+            dictionary: Already-parsed dictionary, likewise
         """
         self.suffix_rules = {}
         self.prefix_rules = {}
         self.sandhi_rules = {}
         self.exceptions = {}
         self.dictionary = {}
-        
+
         # Load rules and dictionary if provided
-        if rules_path and os.path.exists(rules_path):
+        if rules is not None:
+            self.suffix_rules = rules.get('suffix_rules', {})
+            self.prefix_rules = rules.get('prefix_rules', {})
+            self.sandhi_rules = rules.get('sandhi_rules', {})
+            self.exceptions = rules.get('exceptions', {})
+        elif rules_path and os.path.exists(rules_path):
             self.load_rules(rules_path)
         else:
             self.initialize_default_rules()
-            
-        if dictionary_path and os.path.exists(dictionary_path):
+
+        if dictionary is not None:
+            self.dictionary = dictionary
+        elif dictionary_path and os.path.exists(dictionary_path):
             self.load_dictionary(dictionary_path)
         else:
             # Initialize with a minimal dictionary for testing
             self.initialize_minimal_dictionary()
+
+        self._rebuild_sorted()
+
+    def _rules_fingerprint(self):
+        """Stable digest of the current rule set, used as the cache key"""
+        payload = json.dumps(
+            [self.suffix_rules, self.prefix_rules, self.sandhi_rules],
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+    def _try_load_cache(self, fingerprint):
+        """Load the derived structures from disk if they match the rules"""
+        try:
+            with open(_DERIVED_CACHE_PATH, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('fingerprint') != fingerprint:
+                return False
+            self._sorted_suffixes = cached['sorted_suffixes']
+            self._sorted_prefixes = cached['sorted_prefixes']
+            self._suffix_trie = cached['suffix_trie']
+            self._prefix_trie = cached['prefix_trie']
+            self._sandhi_tuple_rules = cached['sandhi_tuple_rules']
+            self._suffix_last_chars = cached['suffix_last_chars']
+            self._prefix_first_chars = cached['prefix_first_chars']
+            self._max_suffix_len = cached['max_suffix_len']
+            self._max_prefix_len = cached['max_prefix_len']
+            self._suffix_feature_strs = cached['suffix_feature_strs']
+            self._prefix_feature_strs = cached['prefix_feature_strs']
+            return True
+        except (OSError, pickle.PickleError, KeyError, EOFError):
+            return False
+
+    def _save_cache(self, fingerprint):
+        """Persist the derived structures; best-effort, failures are fine"""
+        try:
+            os.makedirs(os.path.dirname(_DERIVED_CACHE_PATH), exist_ok=True)
+            with open(_DERIVED_CACHE_PATH, 'wb') as f:
+                pickle.dump({
+                    'fingerprint': fingerprint,
+                    'sorted_suffixes': self._sorted_suffixes,
+                    'sorted_prefixes': self._sorted_prefixes,
+                    'suffix_trie': self._suffix_trie,
+                    'prefix_trie': self._prefix_trie,
+                    'sandhi_tuple_rules': self._sandhi_tuple_rules,
+                    'suffix_last_chars': self._suffix_last_chars,
+                    'prefix_first_chars': self._prefix_first_chars,
+                    'max_suffix_len': self._max_suffix_len,
+                    'max_prefix_len': self._max_prefix_len,
+                    'suffix_feature_strs': self._suffix_feature_strs,
+                    'prefix_feature_strs': self._prefix_feature_strs,
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+    def _rebuild_sorted(self):
+        """Precompute length-sorted affix lists so the hot extraction
+        loops don't re-sort the rule set for every analyzed word"""
+        # Intern the rule keys: Devanagari strings aren't auto-interned
+        # like identifiers, and interned keys let dict probes hit the
+        # pointer-equality fast path in the hot lookups below
+        self.suffix_rules = {sys.intern(k): v for k, v in self.suffix_rules.items()}
+        self.prefix_rules = {sys.intern(k): v for k, v in self.prefix_rules.items()}
+        self.sandhi_rules = {sys.intern(k): v for k, v in self.sandhi_rules.items()}
+
+        # Exceptions get their own interned-key table so analyze()
+        # resolves them with a single probe. The dictionary is NOT
+        # copied in here: root lookups happen on the stripped form, so a
+        # merged table would only duplicate millions of entries
+        self._lookup = {
+            sys.intern(word): info for word, info in self.exceptions.items()
+        }
+
+        fingerprint = self._rules_fingerprint()
+        if self._try_load_cache(fingerprint):
+            self._reset_cache()
+            return
+
+        # Lengths are computed once here and carried through the trie
+        # terminals, so extraction never calls len() or endswith() on a
+        # candidate affix - it slices with the stored length directly
+        self._sorted_suffixes = tuple(
+            (suffix, len(suffix))
+            for suffix in sorted(self.suffix_rules, key=len, reverse=True)
+        )
+        self._sorted_prefixes = tuple(
+            (prefix, len(prefix))
+            for prefix in sorted(self.prefix_rules, key=len, reverse=True)
+        )
+
+        # Build affix tries so extraction is O(word length) regardless of
+        # how many rules are loaded: suffixes go into a trie keyed on the
+        # word read backwards, prefixes into a forward trie. Terminal
+        # nodes ('$') carry (affix, len, features); the deepest terminal
+        # reached is the longest match
+        self._suffix_trie = {}
+        for suffix, suffix_len in self._sorted_suffixes:
+            node = self._suffix_trie
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node['$'] = (suffix, suffix_len, self.suffix_rules[suffix])
+
+        self._prefix_trie = {}
+        for prefix, prefix_len in self._sorted_prefixes:
+            node = self._prefix_trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node['$'] = (prefix, prefix_len, self.prefix_rules[prefix])
+
+        # Pre-render each affix's feature string so display paths do a
+        # dict lookup instead of re-joining the same features per word
+        self._suffix_feature_strs = {
+            suffix: ", ".join(f"{k}: {v}" for k, v in features.items())
+            for suffix, features in self.suffix_rules.items()
+        }
+        self._prefix_feature_strs = {
+            prefix: ", ".join(f"{k}: {v}" for k, v in features.items())
+            for prefix, features in self.prefix_rules.items()
+        }
+
+        # Boundary-character sets and maximum affix lengths let extraction
+        # reject obviously un-affixed words (numerals, code-switched Latin
+        # tokens) with one set probe and bound the trie walks
+        self._suffix_last_chars = frozenset(s[-1] for s, _ in self._sorted_suffixes)
+        self._prefix_first_chars = frozenset(p[0] for p, _ in self._sorted_prefixes)
+        self._max_suffix_len = max((l for _, l in self._sorted_suffixes), default=0)
+        self._max_prefix_len = max((l for _, l in self._sorted_prefixes), default=0)
+
+        # Key sandhi rules on a (last_char, first_char) tuple so junction
+        # probes hash two existing 1-char strings instead of allocating a
+        # fresh 2-char string per lookup; self.sandhi_rules stays the
+        # canonical JSON-serializable form
+        self._sandhi_tuple_rules = {
+            (junction[0], junction[1]): replacement
+            for junction, replacement in self.sandhi_rules.items()
+            if len(junction) == 2
+        }
+
+        self._save_cache(fingerprint)
+        self._reset_cache()
+
+    def _reset_cache(self):
+        """Discard memoized analyses after any rule or dictionary change"""
+        # Words repeat heavily in real text (Zipf), so memoize analyze;
+        # the cache is per-instance and rebuilt whenever rules change
+        self._analyze_cached = functools.lru_cache(maxsize=100000)(self._analyze_impl)
     
     def load_rules(self, rules_path):
         """Load morphological rules from JSON file"""
         try:
-            with open(rules_path, 'r', encoding='utf-8') as f:
-                rules_data = json.load(f)
-                self.suffix_rules = rules_data.get('suffix_rules', {})
-                self.prefix_rules = rules_data.get('prefix_rules', {})
-                self.sandhi_rules = rules_data.get('sandhi_rules', {})
-                self.exceptions = rules_data.get('exceptions', {})
+            rules_data = _read_json(rules_path)
+            self.suffix_rules = rules_data.get('suffix_rules', {})
+            self.prefix_rules = rules_data.get('prefix_rules', {})
+            self.sandhi_rules = rules_data.get('sandhi_rules', {})
+            self.exceptions = rules_data.get('exceptions', {})
         except Exception as e:
             print(f"Error loading rules: {e}")
             self.initialize_default_rules()
+        self._rebuild_sorted()
     
     def initialize_default_rules(self):
         """Initialize with basic Hindi morphological rules"""
@@ -87,15 +358,17 @@ class HindiMorphAnalyzer:
             'ि' + 'आ': 'ी',
             'ु' + 'आ': 'ू',
         }
+
+        self._rebuild_sorted()
     
     def load_dictionary(self, dictionary_path):
         """Load Hindi dictionary/lexicon"""
         try:
-            with open(dictionary_path, 'r', encoding='utf-8') as f:
-                self.dictionary = json.load(f)
+            self.dictionary = _read_json(dictionary_path)
         except Exception as e:
             print(f"Error loading dictionary: {e}")
             self.initialize_minimal_dictionary()
+        self._rebuild_sorted()
     
     def initialize_minimal_dictionary(self):
         """Initialize with a minimal test dictionary"""
@@ -119,10 +392,13 @@ class HindiMorphAnalyzer:
             'छोट': {'category': 'adjective', 'meaning': 'small'},
         }
     
-    def normalize(self, word):
+    @staticmethod
+    def normalize(word):
         """Normalize Hindi text by handling Unicode variations"""
         # Implement Hindi-specific normalization as needed
         # For example, handling half-forms, Nukta, etc.
+        # (e.g. unicodedata.normalize('NFC', word) behind an lru_cache).
+        # Currently the identity, so analyze() skips calling it entirely
         return word
     
     def extract_suffix(self, word):
@@ -132,18 +408,38 @@ class HindiMorphAnalyzer:
         Returns:
             tuple: (root, suffix, features)
         """
-        # Sort suffixes by length (longest first) to avoid substring matches
-        sorted_suffixes = sorted(self.suffix_rules.keys(), key=len, reverse=True)
-        
-        for suffix in sorted_suffixes:
-            if word.endswith(suffix):
-                potential_root = word[:-len(suffix)]
-                # Check if root exists in dictionary or is valid
-                if potential_root in self.dictionary or len(potential_root) >= 2:
-                    return potential_root, suffix, self.suffix_rules[suffix]
-        
+        # A word too short to strip, or one whose last codepoint ends no
+        # known suffix, can't match anything - skip the walk entirely
+        word_len = len(word)
+        if word_len < 2 or word[-1] not in self._suffix_last_chars:
+            return word, "", self._EMPTY_FEATURES
+
+        if _core is not None:
+            return _core.extract_suffix(word, self._suffix_trie, self.dictionary)
+
+        # Walk the word backwards through the suffix trie, collecting
+        # every terminal passed; matches come out shortest to longest.
+        # No suffix is longer than _max_suffix_len, so stop there
+        node = self._suffix_trie
+        matches = []
+        stop = word_len - min(word_len, self._max_suffix_len) - 1
+        for i in range(word_len - 1, stop, -1):
+            node = node.get(word[i])
+            if node is None:
+                break
+            hit = node.get('$')
+            if hit is not None:
+                matches.append(hit)
+
+        # Prefer the longest suffix whose remaining root is valid
+        for suffix, suffix_len, features in reversed(matches):
+            potential_root = word[:-suffix_len]
+            # Check if root exists in dictionary or is valid
+            if potential_root in self.dictionary or len(potential_root) >= 2:
+                return potential_root, suffix, features
+
         # No suffix found
-        return word, "", {}
+        return word, "", self._EMPTY_FEATURES
     
     def extract_prefix(self, word):
         """
@@ -152,19 +448,51 @@ class HindiMorphAnalyzer:
         Returns:
             tuple: (root, prefix, features)
         """
-        # Sort prefixes by length (longest first) to avoid substring matches
-        sorted_prefixes = sorted(self.prefix_rules.keys(), key=len, reverse=True)
-        
-        for prefix in sorted_prefixes:
-            if word.startswith(prefix):
-                potential_root = word[len(prefix):]
-                # Check if root exists in dictionary or is valid
-                if potential_root in self.dictionary or len(potential_root) >= 2:
-                    return potential_root, prefix, self.prefix_rules[prefix]
-        
+        # A word too short to strip, or one whose first codepoint starts no
+        # known prefix, can't match anything - skip the walk entirely
+        word_len = len(word)
+        if word_len < 2 or word[0] not in self._prefix_first_chars:
+            return word, "", self._EMPTY_FEATURES
+
+        if _core is not None:
+            return _core.extract_prefix(word, self._prefix_trie, self.dictionary)
+
+        # Walk the word forwards through the prefix trie, collecting
+        # every terminal passed; matches come out shortest to longest.
+        # No prefix is longer than _max_prefix_len, so stop there
+        node = self._prefix_trie
+        matches = []
+        for i in range(min(word_len, self._max_prefix_len)):
+            node = node.get(word[i])
+            if node is None:
+                break
+            hit = node.get('$')
+            if hit is not None:
+                matches.append(hit)
+
+        # Prefer the longest prefix whose remaining root is valid
+        for prefix, prefix_len, features in reversed(matches):
+            potential_root = word[prefix_len:]
+            # Check if root exists in dictionary or is valid
+            if potential_root in self.dictionary or len(potential_root) >= 2:
+                return potential_root, prefix, features
+
         # No prefix found
-        return word, "", {}
+        return word, "", self._EMPTY_FEATURES
     
+    def _junction(self, left, right):
+        """
+        Check the sandhi rules at the point where left meets right
+
+        Returns:
+            tuple: (left without its last char, replacement, right without
+            its first char) when a rule fires, or None when it doesn't
+        """
+        rule = self._sandhi_tuple_rules.get((left[-1], right[0]))
+        if rule is None:
+            return None
+        return left[:-1], rule, right[1:]
+
     def apply_sandhi_rules(self, parts):
         """Apply sandhi rules to handle morphophonemic changes"""
         if not parts or len(parts) < 2:
@@ -172,13 +500,13 @@ class HindiMorphAnalyzer:
             
         result = parts[0]
         for i in range(1, len(parts)):
-            junction = result[-1] + parts[i][0]  # Get the junction point
-            
+            junction = (result[-1], parts[i][0])  # Get the junction point
+
             # Check if this junction has a sandhi rule
-            if junction in self.sandhi_rules:
+            rule = self._sandhi_tuple_rules.get(junction)
+            if rule is not None:
                 # Apply the sandhi rule
-                combined = result[:-1] + self.sandhi_rules[junction] + parts[i][1:]
-                result = combined
+                result = result[:-1] + rule + parts[i][1:]
             else:
                 result += parts[i]
         
@@ -187,16 +515,22 @@ class HindiMorphAnalyzer:
     def analyze(self, word):
         """
         Analyze a Hindi word into its morphological components
-        
+
         Args:
             word: Hindi word to analyze
-        
+
         Returns:
-            dict: Morphological analysis result
+            AnalysisResult: Morphological analysis result (treat as
+            read-only; repeated words share one memoized result)
         """
+        return self._analyze_cached(word)
+
+    def _analyze_impl(self, word):
+        """Uncached analysis; analyze() memoizes this per instance"""
         # Handle exception words
-        if word in self.exceptions:
-            return self.exceptions[word]
+        hit = self._lookup.get(word)
+        if hit is not None:
+            return hit
         
         # Normalize the word
         # normalized = self.normalize(word)
@@ -207,38 +541,36 @@ class HindiMorphAnalyzer:
         # Extract prefix from the remaining root
         final_root, prefix, prefix_features = self.extract_prefix(root_after_suffix)
         
-        # Apply sandhi rules if needed
+        # Apply sandhi rules if needed; _junction short-circuits so the
+        # common no-rule case skips string reconstruction entirely
         if prefix and final_root:
-            # Apply sandhi rules at prefix-root junction
-            parts = [prefix, final_root]
-            combined = self.apply_sandhi_rules(parts)
-            final_root = combined[len(prefix):]  # Remove prefix from the combined result
-        
+            # Check sandhi at the prefix-root junction
+            hit = self._junction(prefix, final_root)
+            if hit is not None:
+                head, replacement, tail = hit
+                final_root = (head + replacement + tail)[len(prefix):]
+
         if final_root and suffix:
-            # Apply sandhi rules at root-suffix junction
-            parts = [final_root, suffix]
-            combined = self.apply_sandhi_rules(parts)
-            if combined != final_root + suffix:
-                # If sandhi rules were applied, update the root
-                final_root = combined[:-len(suffix)]
+            # Check sandhi at the root-suffix junction
+            hit = self._junction(final_root, suffix)
+            if hit is not None:
+                head, replacement, tail = hit
+                final_root = (head + replacement + tail)[:-len(suffix)]
         
         # Lookup root word in dictionary if available
-        root_info = self.dictionary.get(final_root, {'category': 'unknown', 'meaning': 'unknown'})
+        root_info = self.dictionary.get(final_root, self._UNKNOWN_ROOT_INFO)
         
         # Combine all morphological information
-        analysis = {
-            'original': word,
-            # 'normalized': normalized,
-            'root': final_root,
-            'root_info': root_info,
-            'suffix': suffix,
-            'suffix_features': suffix_features,
-            'prefix': prefix,
-            'prefix_features': prefix_features,
-            'sandhi_applied': True if prefix or suffix else False
-        }
-        
-        return analysis
+        return AnalysisResult(
+            original=word,
+            root=final_root,
+            root_info=root_info,
+            suffix=suffix,
+            suffix_features=suffix_features,
+            prefix=prefix,
+            prefix_features=prefix_features,
+            sandhi_applied=True if prefix or suffix else False,
+        )
     
     def save_rules(self, file_path):
         """Save the current rules to a JSON file"""
@@ -250,8 +582,7 @@ class HindiMorphAnalyzer:
         }
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(rules_data, f, ensure_ascii=False, indent=2)
+            _write_json(rules_data, file_path)
             return True
         except Exception as e:
             print(f"Error saving rules: {e}")
@@ -269,20 +600,53 @@ class HindiMorphAnalyzer:
         """
         # Simple tokenization by splitting on whitespace
         # In a full implementation, use a proper Hindi tokenizer
-        words = text.split()
-        
+        return self.process_text_tokens(text.split())
+
+    def process_text_tokens(self, tokens):
+        """
+        Analyze a pre-split token list
+
+        Entry point for callers that already hold the tokens (CLI
+        batch/repl), so the text isn't scanned a second time.
+
+        Args:
+            tokens: List of whitespace-free Hindi tokens
+
+        Returns:
+            list: List of analyzed words
+        """
         results = []
-        for word in words:
+        for word in tokens:
             # Remove punctuation
-            clean_word = re.sub(r'[।,;.!?()[\]{}:"\'-]', '', word)
+            clean_word = word.translate(self._PUNCT_TABLE)
             if clean_word:
                 analysis = self.analyze(clean_word)
                 results.append(analysis)
-        
+
         return results
 
+    def process_batch(self, texts):
+        """
+        Process several Hindi texts, analyzing each word
+
+        Tokenization is a single C-level regex pass per text and repeated
+        tokens across texts share the memoized analyze() results.
+
+        Args:
+            texts: List of Hindi texts to analyze
+
+        Returns:
+            list: One list of analyzed words per input text
+        """
+        findall = self._TOKEN_RE.findall
+        analyze = self._analyze_cached
+        return [[analyze(token) for token in findall(text)] for text in texts]
+
 # Utility functions for dataset creation and handling
 
+# Test-item keys that are not morphological features
+_EXCLUDED_KEYS = frozenset({'word', 'root', 'category'})
+
 def create_test_dataset(size=100):
     """Create a simple test dataset for the morphology analyzer"""
     test_data = []
@@ -350,15 +714,11 @@ def evaluate_analyzer(analyzer, test_data):
             correct_category += 1
         
         # Check if key features are identified correctly
-        # This is a simplistic approach - in a real implementation, 
+        # This is a simplistic approach - in a real implementation,
         # we'd need more sophisticated feature comparison
-        features_match = True
-        for key, value in item.items():
-            if key not in ["word", "root", "category"]:
-                if key not in result["suffix_features"] or result["suffix_features"][key] != value:
-                    features_match = False
-                    break
-        
+        expected = {k: v for k, v in item.items() if k not in _EXCLUDED_KEYS}
+        features_match = expected.items() <= result["suffix_features"].items()
+
         if features_match:
             correct_features += 1
     
@@ -401,12 +761,18 @@ def main():
         
         if analysis['suffix']:
             print(f"Suffix: {analysis['suffix']}")
-            features = ", ".join([f"{k}: {v}" for k, v in analysis['suffix_features'].items()])
+            features = analyzer._suffix_feature_strs.get(
+                analysis['suffix'],
+                ", ".join(f"{k}: {v}" for k, v in analysis['suffix_features'].items())
+            )
             print(f"Features: {features}")
-        
+
         if analysis['prefix']:
             print(f"Prefix: {analysis['prefix']}")
-            prefix_info = ", ".join([f"{k}: {v}" for k, v in analysis['prefix_features'].items()])
+            prefix_info = analyzer._prefix_feature_strs.get(
+                analysis['prefix'],
+                ", ".join(f"{k}: {v}" for k, v in analysis['prefix_features'].items())
+            )
             print(f"Prefix Info: {prefix_info}")
     
     # Create and evaluate on test dataset
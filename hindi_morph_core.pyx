@@ -0,0 +1,60 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Compiled kernels for the Hindi Morphology Analyzer
+#
+# Ports the hot affix-extraction trie walks from hindi_morph_analyzer to
+# C-level loops. Build in place with:
+#
+#     python setup.py build_ext --inplace
+#
+# hindi_morph_analyzer falls back to its pure-Python implementations
+# automatically when this extension has not been built.
+
+
+cpdef tuple extract_suffix(unicode word, dict suffix_trie, dict dictionary):
+    """Trie-based suffix extraction; mirrors HindiMorphAnalyzer.extract_suffix"""
+    cdef Py_ssize_t i, word_len = len(word)
+    cdef list matches = []
+    cdef unicode potential_root
+    node = suffix_trie
+
+    # Walk the word backwards, collecting every terminal passed
+    for i in range(word_len - 1, -1, -1):
+        node = node.get(word[i])
+        if node is None:
+            break
+        hit = node.get('$')
+        if hit is not None:
+            matches.append(hit)
+
+    # Prefer the longest suffix whose remaining root is valid
+    for hit in reversed(matches):
+        potential_root = word[:word_len - <Py_ssize_t>hit[1]]
+        if potential_root in dictionary or len(potential_root) >= 2:
+            return potential_root, hit[0], hit[2]
+
+    return word, u"", {}
+
+
+cpdef tuple extract_prefix(unicode word, dict prefix_trie, dict dictionary):
+    """Trie-based prefix extraction; mirrors HindiMorphAnalyzer.extract_prefix"""
+    cdef Py_ssize_t i, word_len = len(word)
+    cdef list matches = []
+    cdef unicode potential_root
+    node = prefix_trie
+
+    # Walk the word forwards, collecting every terminal passed
+    for i in range(word_len):
+        node = node.get(word[i])
+        if node is None:
+            break
+        hit = node.get('$')
+        if hit is not None:
+            matches.append(hit)
+
+    # Prefer the longest prefix whose remaining root is valid
+    for hit in reversed(matches):
+        potential_root = word[<Py_ssize_t>hit[1]:]
+        if potential_root in dictionary or len(potential_root) >= 2:
+            return potential_root, hit[0], hit[2]
+
+    return word, u"", {}
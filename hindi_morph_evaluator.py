@@ -9,7 +9,10 @@ Tests the analyzer with sample Hindi sentences and evaluates performance
 import os
 import json
 import time
-from hindi_morph_analyzer import HindiMorphAnalyzer
+from hindi_morph_analyzer import HindiMorphAnalyzer, results_to_dicts, _write_json
+
+# Strips punctuation in a single C loop when counting words
+_PUNCT_TABLE = str.maketrans('', '', '।,;.!?:"\'-()')
 
 def load_test_sentences():
     """Load test sentences for evaluation"""
@@ -26,78 +29,78 @@ def load_test_sentences():
         "यह फल बहुत मीठा है।"                   # This fruit is very sweet.
     ]
 
-def evaluate_analyzer_on_sentences(analyzer, sentences):
+def evaluate_analyzer_on_sentences(analyzer, sentences, verbose=True):
     """
     Evaluate the morphology analyzer on a set of Hindi sentences
-    
+
     Args:
         analyzer: HindiMorphAnalyzer instance
         sentences: List of Hindi sentences for testing
-        
+        verbose: Print the word-by-word analysis report
+
     Returns:
         dict: Performance metrics and analysis results
     """
     results = []
     total_words = 0
-    total_time = 0
-    
+    lines = []
+
     print("\nEvaluating analyzer on test sentences...")
-    
-    for sentence in sentences:
-        print(f"\nSentence: {sentence}")
-        
-        # Record start time
-        start_time = time.time()
-        
-        # Process the sentence
-        analysis = analyzer.process_text(sentence)
-        
-        # Record end time
-        end_time = time.time()
-        processing_time = end_time - start_time
-        
+
+    # Time the whole batch in one measurement; perf_counter_ns is
+    # monotonic and far finer-grained than time.time (~15 ms on some
+    # platforms, more than a whole batch takes)
+    start_time = time.perf_counter_ns()
+    analyses = analyzer.process_batch(sentences)
+    total_time = (time.perf_counter_ns() - start_time) * 1e-9
+
+    for sentence, analysis in zip(sentences, analyses):
         # Count words (excluding punctuation)
-        words = [word for word in sentence.split() if not all(c in '।,;.!?:"\'-()' for c in word)]
+        words = [word for word in sentence.split() if word.translate(_PUNCT_TABLE)]
         word_count = len(words)
         total_words += word_count
-        total_time += processing_time
-        
-        # Display results
-        print(f"Word count: {word_count}")
-        print(f"Processing time: {processing_time:.4f} seconds")
-        print(f"Words per second: {word_count / processing_time:.2f}")
-        
-        # Display word-by-word analysis
-        print("\nWord-by-word analysis:")
+
+        # Buffer the report; one print at the end keeps terminal I/O out
+        # of the loop
+        lines.append(f"\nSentence: {sentence}")
+        lines.append(f"Word count: {word_count}")
+
+        # Word-by-word analysis
+        lines.append("\nWord-by-word analysis:")
         for idx, word_analysis in enumerate(analysis):
             word = word_analysis['original']
             root = word_analysis['root']
             category = word_analysis['root_info'].get('category', 'unknown')
-            
-            # Get morphological features
+
+            # Get morphological features (.get: exception entries carry
+            # no feature dicts)
             features = []
-            if word_analysis['suffix_features']:
-                features.extend([f"{k}: {v}" for k, v in word_analysis['suffix_features'].items()])
-            
-            if word_analysis['prefix_features']:
-                features.extend([f"{k}: {v}" for k, v in word_analysis['prefix_features'].items()])
-            
+            suffix_features = word_analysis.get('suffix_features')
+            if suffix_features:
+                features.extend(f"{k}: {v}" for k, v in suffix_features.items())
+
+            prefix_features = word_analysis.get('prefix_features')
+            if prefix_features:
+                features.extend(f"{k}: {v}" for k, v in prefix_features.items())
+
             features_str = ", ".join(features) if features else "None"
-            
-            print(f"  {idx+1}. Word: {word} | Root: {root} | Category: {category} | Features: {features_str}")
-        
+
+            lines.append(f"  {idx+1}. Word: {word} | Root: {root} | Category: {category} | Features: {features_str}")
+
         # Store result
         results.append({
             'sentence': sentence,
             'word_count': word_count,
-            'processing_time': processing_time,
-            'words_per_second': word_count / processing_time,
             'analysis': analysis
         })
+
+    if verbose:
+        print("\n".join(lines))
     
     # Calculate overall metrics
     average_time_per_word = total_time / total_words if total_words > 0 else 0
-    words_per_second = total_words / total_time if total_time > 0 else 0
+    # Clamp the divisor so a near-zero measurement can't blow up the rate
+    words_per_second = total_words / max(total_time, 1e-9)
     
     metrics = {
         'total_sentences': len(sentences),
@@ -229,14 +232,17 @@ def main():
     # Generate error analysis
     errors = generate_error_analysis(analyzer, test_data)
     
-    # Save evaluation results
+    # Save evaluation results, converting analyses to plain dicts at the
+    # serialization boundary
+    for sentence_result in evaluation['results']:
+        sentence_result['analysis'] = results_to_dicts(sentence_result['analysis'])
+
     output = {
         'sentence_evaluation': evaluation,
         'error_analysis': errors
     }
     
-    with open("evaluation_results.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    _write_json(output, "evaluation_results.json")
     
     print("\nEvaluation complete. Results saved to evaluation_results.json")
 
@@ -7,18 +7,58 @@ A graphical user interface for the Hindi Morphology Analyzer
 """
 
 import os
+import re
 import sys
 import json
+import queue
+import pickle
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
+# Constants bound at import time: saves a tk-module attribute lookup at
+# every widget call that uses them
+from tkinter import (BOTH, BOTTOM, CENTER, DISABLED, END, NORMAL, RIGHT,
+                     SUNKEN, VERTICAL, WORD, E, W, X, Y)
 from tkinter import ttk, scrolledtext, filedialog, messagebox
-from hindi_morph_analyzer import HindiMorphAnalyzer
+from tkinter import font as tkfont
+# hindi_morph_analyzer is imported lazily inside initialize_analyzer so
+# that merely loading this module (help text, tooling) stays cheap; the
+# background loader thread pays the cost instead
 
-# Add DPI awareness
+# orjson parses the big dictionary files several times faster than the
+# stdlib; fall back silently when it isn't installed
 try:
-    from ctypes import windll
-    windll.shcore.SetProcessDpiAwareness(1)
-except:
-    pass
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Built-in demo words; a module-level tuple so GUI instances share it
+_SAMPLE_WORDS = (
+    "लड़का",
+    "पढ़ता",
+    "अशुभ",
+    "सुरक्षा",
+    "अप्रसन्नता",
+)
+
+# Precomputed analyses for the sample words; clicking a sample button
+# displays these directly without touching the analyzer
+_SAMPLE_CACHE_PATH = "samples.cache.json"
+
+# Default data files picked up from the working directory; named once so
+# the existence check and the load can never drift apart
+_DEFAULT_RULES_FILE = "hindi_morph_rules.json"
+_DEFAULT_DICT_FILE = "enhanced_hindi_dictionary_v2.json"
+
+# Add DPI awareness; the platform check skips the doomed ctypes import
+# (and the exception it raises) everywhere but Windows
+if sys.platform == 'win32':
+    try:
+        from ctypes import windll
+        windll.shcore.SetProcessDpiAwareness(1)
+    except (ImportError, OSError, AttributeError):
+        pass
 
 class HindiMorphGUI:
     def __init__(self, root):
@@ -31,210 +71,588 @@ class HindiMorphGUI:
         self.root.resizable(True, True)
         self.root.minsize(600, 700)
                 
-        # Initialize analyzer
-        self.initialize_analyzer()
-        
+        # Analyzer loads in the background so the window paints without
+        # waiting for the rules/dictionary JSON parse
+        self._analyzer = None
+        self._analyzer_ready = threading.Event()
+
+        # lru_cache wrapper around analyzer.analyze, built once the
+        # analyzer loads; repeated words (re-clicks, stopwords in files)
+        # become dict hits with bounded memory
+        self._analyze_one = None
+
+        # Precomputed sample-word analyses from disk; refreshed by the
+        # background loader once the analyzer is up
+        try:
+            with open(_SAMPLE_CACHE_PATH, 'r', encoding='utf-8') as f:
+                self._sample_cache = json.load(f)
+        except (OSError, ValueError):
+            self._sample_cache = {}
+
+        # Detail text is rendered eagerly after each analysis so
+        # show_details only has to display it; the Toplevel that shows it
+        # is built once and reused
+        self._detail_text = None
+        self._detail_window = None
+        self._detail_widget = None
+
         # Create main frame
         self.main_frame = ttk.Frame(root, padding="10")
-        self.main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Create UI elements
-        self.create_menu()
-        self.create_input_frame()
-        self.create_output_frame()
-        self.create_statusbar()
-    
+        self.main_frame.pack(fill=BOTH, expand=True)
+
+        # Worker-to-UI handoff for batch file analysis. Queue items are
+        # tagged with the batch id current when the worker started, so
+        # opening a second file mid-analysis orphans the first batch's
+        # rows instead of interleaving them
+        self._result_queue = queue.Queue()
+        self._batch_id = 0
+        self._drain_running = False
+
+        # Single-worker executor for interactive analyses; results come
+        # back to the Tk thread via root.after
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        # Batch results are virtualized: raw analyses and preformatted
+        # row tuples live in these lists, and only the rows near the
+        # current scroll position are actually inserted into the Treeview
+        self._results = []
+        self._row_cache = []
+        self._view_start = 0
+
+        # Shared Font objects: each ('Nirmala UI', N) tuple passed to a
+        # widget makes Tk allocate a new font, these three are reused
+        self._fonts = {
+            'big': tkfont.Font(root=self.root, family='Nirmala UI',
+                               size=14, weight='bold'),
+            'med': tkfont.Font(root=self.root, family='Nirmala UI', size=13),
+            'small': tkfont.Font(root=self.root, family='Nirmala UI', size=12),
+        }
+
+        # One StringVar per display field, built in a single pass with
+        # explicit Tcl names; the attribute aliases below keep callers
+        # unchanged
+        self._vars = {
+            name: tk.StringVar(master=self.root, name=f'hma_{name}')
+            for name in ('word', 'root', 'prefix', 'suffix', 'status')
+        }
+        self.result_word_var = self._vars['word']
+        self.result_root_var = self._vars['root']
+        self.result_prefix_var = self._vars['prefix']
+        self.result_suffix_var = self._vars['suffix']
+        self.status_var = self._vars['status']
+
+        # Create UI elements; freezing pack propagation while the widget
+        # tree is built collapses the per-child geometry recalculations
+        # into one pass when it is re-enabled
+        self.main_frame.pack_propagate(False)
+        try:
+            self.create_menu()
+            self.create_input_frame()
+            self.create_output_frame()
+            self.create_batch_frame()
+            self.create_statusbar()
+        finally:
+            self.main_frame.pack_propagate(True)
+
+        # Kick off the analyzer load once the UI exists
+        threading.Thread(target=self._bg_load_analyzer, daemon=True).start()
+
+    @property
+    def analyzer(self):
+        """The morphology analyzer; blocks if the background load is
+        still running"""
+        if self._analyzer is None:
+            self._analyzer_ready.wait()
+        return self._analyzer
+
+    def _bg_load_analyzer(self):
+        """Background-thread analyzer construction"""
+        try:
+            self.initialize_analyzer()
+        except Exception as e:
+            # A corrupt rules/dictionary file must not strand the UI
+            # with the ready event unset (the Analyze path and the menu
+            # handlers would block on it forever): fall back to the
+            # built-in defaults and surface the error on the Tk thread
+            from hindi_morph_analyzer import HindiMorphAnalyzer
+            analyzer = HindiMorphAnalyzer()
+            self._sandhi_rules = analyzer.sandhi_rules
+            self._analyze_one = functools.lru_cache(maxsize=8192)(analyzer.analyze)
+            self._analyzer = analyzer
+            self.rules_path = None
+            self.dict_path = None
+
+            message = f"Error loading analyzer data, using default rules: {e}"
+
+            def report():
+                self.status_var.set("Analyzer loaded with default rules")
+                messagebox.showerror("Load Error", message)
+
+            self.root.after(0, report)
+        finally:
+            self._analyzer_ready.set()
+        self._refresh_sample_cache()
+
+    def _refresh_sample_cache(self):
+        """Recompute and persist the sample-word analyses if the cache on
+        disk doesn't cover the current sample set"""
+        if set(self._sample_cache) == set(_SAMPLE_WORDS):
+            return
+        from hindi_morph_analyzer import results_to_dicts
+        analyses = results_to_dicts(
+            [self._analyzer.analyze(word) for word in _SAMPLE_WORDS])
+        self._sample_cache = dict(zip(_SAMPLE_WORDS, analyses))
+        try:
+            with open(_SAMPLE_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(self._sample_cache, f, ensure_ascii=False, indent=2)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _load_json_cached(file_path):
+        """
+        Parse a JSON file through a pickle sidecar cache
+
+        pickle.load of the prebuilt dict skips JSON tokenization entirely,
+        so launches after the first are much faster. The sidecar
+        (file_path + '.pkl') is refreshed whenever the JSON is newer.
+        """
+        cache_path = file_path + '.pkl'
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+
+        if _orjson is not None:
+            # Read bytes and let orjson handle the UTF-8 decode
+            with open(file_path, 'rb') as f:
+                data = _orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+        return data
 
     def initialize_analyzer(self):
         """Initialize the morphology analyzer"""
-        rules_path = "hindi_morph_rules.json" if os.path.exists("hindi_morph_rules.json") else None
-        dict_path = "enhanced_hindi_dictionary_v2.json" if os.path.exists("enhanced_hindi_dictionary_v2.json") else None
-        
-        self.analyzer = HindiMorphAnalyzer(rules_path=rules_path, dictionary_path=dict_path)
+        from hindi_morph_analyzer import HindiMorphAnalyzer
+
+        # One directory scan answers both existence checks instead of a
+        # stat call per candidate file
+        with os.scandir('.') as entries:
+            present = {entry.name for entry in entries}
+
+        rules_path = _DEFAULT_RULES_FILE if _DEFAULT_RULES_FILE in present else None
+        dict_path = _DEFAULT_DICT_FILE if _DEFAULT_DICT_FILE in present else None
+
+        # Parse via the sidecar cache and hand the analyzer prebuilt dicts
+        # so it skips its own JSON load
+        rules = self._load_json_cached(rules_path) if rules_path else None
+        dictionary = self._load_json_cached(dict_path) if dict_path else None
+
+        analyzer = HindiMorphAnalyzer(rules=rules, dictionary=dictionary)
+        # Pre-resolve the sandhi table so the detail renderer doesn't
+        # re-check for it per call
+        self._sandhi_rules = analyzer.sandhi_rules
+        self._analyze_one = functools.lru_cache(maxsize=8192)(analyzer.analyze)
+        # Published last: the analyzer property stops waiting on the
+        # load event as soon as this attribute is set, so everything a
+        # worker may touch has to be in place already
+        self._analyzer = analyzer
         self.rules_path = rules_path
         self.dict_path = dict_path
     
     def create_menu(self):
         """Create application menu"""
         menubar = tk.Menu(self.root)
-        
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="Open Text", command=self.open_text_file)
-        file_menu.add_command(label="Save Results", command=self.save_results)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        menubar.add_cascade(label="File", menu=file_menu)
-        
-        # Configure menu
-        config_menu = tk.Menu(menubar, tearoff=0)
-        config_menu.add_command(label="Load Rules", command=self.load_rules)
-        config_menu.add_command(label="Load Dictionary", command=self.load_dictionary)
-        menubar.add_cascade(label="Configure", menu=config_menu)
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        help_menu.add_command(label="About", command=self.show_about)
-        help_menu.add_command(label="Help", command=self.show_help)
-        menubar.add_cascade(label="Help", menu=help_menu)
-                
+
+        # Data-driven layout: one tight loop issues all the Python->Tcl
+        # calls; None marks a separator
+        menu_spec = (
+            ("File", (("Open Text", self.open_text_file),
+                      ("Save Results", self.save_results),
+                      None,
+                      ("Exit", self.root.quit))),
+            ("Configure", (("Load Rules", self.load_rules),
+                           ("Load Dictionary", self.load_dictionary))),
+            ("Help", (("About", self.show_about),
+                      ("Help", self.show_help))),
+        )
+
+        for cascade_label, entries in menu_spec:
+            menu = tk.Menu(menubar, tearoff=0)
+            add_command = menu.add_command
+            for entry in entries:
+                if entry is None:
+                    menu.add_separator()
+                else:
+                    add_command(label=entry[0], command=entry[1])
+            menubar.add_cascade(label=cascade_label, menu=menu)
+
         self.root.config(menu=menubar)
     
     def create_input_frame(self):
         """Create input frame with text area and buttons"""
         input_frame = ttk.LabelFrame(self.main_frame, text="Enter Hindi Word", padding="5")
-        input_frame.pack(fill=tk.BOTH, pady=5)
+        input_frame.pack(fill=BOTH, pady=5)
         
         # Text input area - single line
         self.input_text = ttk.Entry(input_frame)
-        self.input_text.pack(fill=tk.X, padx=5, pady=5)
+        self.input_text.pack(fill=X, padx=5, pady=5)
         
         # Sample words frame
         sample_frame = ttk.LabelFrame(input_frame, text="Sample Words", padding="5")
-        sample_frame.pack(fill=tk.X, padx=5, pady=5)
+        sample_frame.pack(fill=X, padx=5, pady=5)
         
-        sample_words = [
-            "लड़का",
-            "पढ़ता",
-            "अशुभ",
-            "सुरक्षा",
-            "अप्रसन्नता"
-        ]
-        
-        # Create sample word buttons in a grid
-        for i, word in enumerate(sample_words):
-            btn = ttk.Button(sample_frame, text=word, 
-                            command=lambda w=word: self.load_sample(w))
+        # Create sample word buttons in a grid; functools.partial is a
+        # C-level callable, cheaper than one closure per button
+        for i, word in enumerate(_SAMPLE_WORDS):
+            btn = ttk.Button(sample_frame, text=word,
+                            command=functools.partial(self.load_sample, word))
             btn.grid(row=i//3, column=i%3, padx=2, pady=2, sticky='ew')
+        for column in range(3):
+            sample_frame.columnconfigure(column, weight=1)
         
         # Button frame
         button_frame = ttk.Frame(input_frame)
-        button_frame.pack(fill=tk.X, padx=5, pady=5)
+        button_frame.pack(fill=X, padx=5, pady=5)
         
-        # Analyze and Clear buttons
-        analyze_btn = ttk.Button(button_frame, text="Analyze", command=self.analyze_text)
-        analyze_btn.pack(side=tk.RIGHT, padx=5)
+        # Analyze and Clear buttons; the Analyze button is kept as an
+        # attribute so it can be disabled while a worker analysis runs
+        self.analyze_btn = ttk.Button(button_frame, text="Analyze", command=self.analyze_text)
+        self.analyze_btn.pack(side=RIGHT, padx=5)
         
         clear_btn = ttk.Button(button_frame, text="Clear", command=self.clear_input)
-        clear_btn.pack(side=tk.RIGHT, padx=5)
+        clear_btn.pack(side=RIGHT, padx=5)
     
     def create_output_frame(self):
         """Create output frame with results area"""
         output_frame = ttk.LabelFrame(self.main_frame, text="Analysis Results", padding="10")
-        output_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        output_frame.pack(fill=BOTH, expand=True, pady=10)
         
         # Main results frame with centered content
         result_frame = ttk.Frame(output_frame)
-        result_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        # Create frames for each result row with distinctive styling
-        self.result_word_var = tk.StringVar()
-        self.result_root_var = tk.StringVar()
-        self.result_prefix_var = tk.StringVar()
-        self.result_suffix_var = tk.StringVar()
-        
-        # Word frame
-        word_frame = ttk.Frame(result_frame, padding="5")
-        word_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(word_frame, text="Word:", width=15, anchor=tk.E).pack(side=tk.LEFT, padx=5)
-        ttk.Label(word_frame, textvariable=self.result_word_var, font=('Nirmala UI', 14, 'bold')).pack(side=tk.LEFT, padx=5)
-        
-        # Root frame with highlight
-        root_frame = ttk.Frame(result_frame, padding="5")
-        root_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(root_frame, text="Root:", width=15, anchor=tk.E).pack(side=tk.LEFT, padx=5)
-        self.root_label = ttk.Label(root_frame, textvariable=self.result_root_var, font=('Nirmala UI', 13))
-        self.root_label.pack(side=tk.LEFT, padx=5)
-        
-        # Prefix frame
-        prefix_frame = ttk.Frame(result_frame, padding="5")
-        prefix_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(prefix_frame, text="Prefix:", width=15, anchor=tk.E).pack(side=tk.LEFT, padx=5)
-        self.prefix_label = ttk.Label(prefix_frame, textvariable=self.result_prefix_var, font=('Nirmala UI', 12))
-        self.prefix_label.pack(side=tk.LEFT, padx=5)
-        
-        # Suffix frame
-        suffix_frame = ttk.Frame(result_frame, padding="5")
-        suffix_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(suffix_frame, text="Suffix:", width=15, anchor=tk.E).pack(side=tk.LEFT, padx=5)
-        self.suffix_label = ttk.Label(suffix_frame, textvariable=self.result_suffix_var, font=('Nirmala UI', 12))
-        self.suffix_label.pack(side=tk.LEFT, padx=5)
-        
+        result_frame.pack(fill=BOTH, expand=True, padx=20, pady=10)
+        
+        # One grid on result_frame replaces the four per-row Frames:
+        # half the widgets and a single geometry-manager pass
+        rows = (
+            ("Word:", self.result_word_var, self._fonts['big']),
+            ("Root:", self.result_root_var, self._fonts['med']),
+            ("Prefix:", self.result_prefix_var, self._fonts['small']),
+            ("Suffix:", self.result_suffix_var, self._fonts['small']),
+        )
+        value_labels = []
+        for i, (caption, var, font) in enumerate(rows):
+            ttk.Label(result_frame, text=caption, width=15, anchor=E).grid(
+                row=i, column=0, padx=5, pady=10, sticky=E)
+            value_label = ttk.Label(result_frame, textvariable=var, font=font)
+            value_label.grid(row=i, column=1, padx=5, pady=10, sticky=W)
+            value_labels.append(value_label)
+        _, self.root_label, self.prefix_label, self.suffix_label = value_labels
+
         # Add Detail View button centered at bottom
         button_frame = ttk.Frame(output_frame)
-        button_frame.pack(side=tk.BOTTOM, pady=10, fill=tk.X)
+        button_frame.pack(side=BOTTOM, pady=10, fill=X)
         detail_btn = ttk.Button(button_frame, text="Show Details", command=self.show_details)
-        detail_btn.pack(side=tk.BOTTOM, anchor=tk.CENTER)
+        detail_btn.pack(side=BOTTOM, anchor=CENTER)
+
+    def create_batch_frame(self):
+        """Create the table that shows per-word results for analyzed files"""
+        self.tree_columns = ('word', 'root', 'prefix', 'suffix', 'category')
+        batch_frame = ttk.LabelFrame(self.main_frame, text="File Analysis", padding="5")
+        batch_frame.pack(fill=BOTH, expand=True, pady=5)
+
+        self.formatted_output = ttk.Treeview(
+            batch_frame, columns=self.tree_columns, show='headings', height=6
+        )
+        for column, heading in zip(self.tree_columns,
+                                   ('Word', 'Root', 'Prefix', 'Suffix', 'Category')):
+            self.formatted_output.heading(column, text=heading)
+            self.formatted_output.column(column, width=100, anchor=W)
+
+        # The scrollbar drives the virtual window over _row_cache rather
+        # than the Treeview's own (window-local) yview
+        self._tree_scrollbar = ttk.Scrollbar(batch_frame, orient=VERTICAL,
+                                             command=self._tree_yview)
+        self._tree_scrollbar.pack(side=RIGHT, fill=Y)
+        self.formatted_output.pack(fill=BOTH, expand=True)
+        self.formatted_output.bind('<Configure>',
+                                   lambda event: self._refresh_visible())
+        # Wheel events scroll the virtual window too; left to the
+        # Treeview they would only pan over the materialized rows
+        self.formatted_output.bind('<MouseWheel>', self._on_tree_wheel)
+        self.formatted_output.bind('<Button-4>', self._on_tree_wheel)
+        self.formatted_output.bind('<Button-5>', self._on_tree_wheel)
+
+    def _on_tree_wheel(self, event):
+        """Translate wheel events into virtual-window scroll steps"""
+        # <Button-4>/<Button-5> are the X11 wheel; elsewhere the sign of
+        # event.delta carries the direction
+        up = getattr(event, 'num', 0) == 4 or event.delta > 0
+        self._tree_yview('scroll', -3 if up else 3, 'units')
+        return 'break'  # Suppress the Treeview's own (window-local) scroll
+
+    def _batch_analyze(self, words, batch_id):
+        """Worker thread: analyze words and queue results for the UI"""
+        _ = self.analyzer  # Blocks until the background load finishes
+        analyze = self._analyze_one
+        row_values = self._row_values
+        put = self._result_queue.put
+        # Repeated surface forms reuse the first (result, row) pair, so
+        # duplicates skip the row formatting as well as the analysis
+        per = {}
+        for word in words:
+            item = per.get(word)
+            if item is None:
+                result = analyze(word)
+                item = per[word] = (result, row_values(result))
+            put((batch_id, item))
+        put((batch_id, None))  # Sentinel: batch finished
+
+    def _batch_analyze_file(self, file_path, batch_id):
+        """Worker thread: stream a large file line by line so it is never
+        resident in memory all at once"""
+        _ = self.analyzer  # Blocks until the background load finishes
+        analyze = self._analyze_one
+        row_values = self._row_values
+        put = self._result_queue.put
+        per = {}
+        with open(file_path, 'r', encoding='utf-8', errors='replace',
+                  buffering=1 << 16) as file:
+            for line in file:
+                for word in line.split():
+                    item = per.get(word)
+                    if item is None:
+                        result = analyze(word)
+                        item = per[word] = (result, row_values(result))
+                    put((batch_id, item))
+        put((batch_id, None))
+
+    def _start_drain(self):
+        """Schedule the drain chain unless one is already running; a
+        second chain would just double-poll the same queue"""
+        if not self._drain_running:
+            self._drain_running = True
+            self.root.after(50, self._drain_results)
+
+    def _drain_results(self):
+        """Move queued results into the row cache, at most 200 per tick
+        so the event loop keeps redrawing during large files"""
+        for _ in range(200):
+            try:
+                batch_id, item = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if batch_id != self._batch_id:
+                # Leftover from a batch superseded by a newer file; its
+                # sentinel must not stop the current drain either
+                continue
+            if item is None:
+                self.status_var.set("File analysis complete")
+                self._refresh_visible()
+                self._drain_running = False
+                return
+            # Row tuples arrive preformatted from the worker thread, so
+            # this Tk-side loop only appends
+            result, row = item
+            self._results.append(result)
+            self._row_cache.append(row)
+        self._refresh_visible()
+        self.root.after(50, self._drain_results)
+
+    @staticmethod
+    def _row_values(result):
+        """Format one analysis as a Treeview row tuple"""
+        root_info = result.get('root_info') or {}
+        return (
+            result['original'],
+            result['root'],
+            result.get('prefix', '') or '-',
+            result.get('suffix', '') or '-',
+            root_info.get('category', 'unknown'),
+        )
+
+    # How many cached rows are materialized as real Treeview items; the
+    # widget itself shows far fewer, the rest is scroll headroom
+    _VISIBLE_ROWS = 50
+
+    def _reset_batch_table(self):
+        """Clear the batch table and its backing caches"""
+        self._results.clear()
+        self._row_cache.clear()
+        self._view_start = 0
+        self.formatted_output.delete(*self.formatted_output.get_children())
+
+    def _tree_yview(self, action, *args):
+        """Scrollbar callback: move the virtual window over _row_cache"""
+        total = len(self._row_cache)
+        if not total:
+            return
+        window = self._VISIBLE_ROWS
+        if action == 'moveto':
+            start = int(float(args[0]) * total)
+        else:  # 'scroll', amount, 'units'|'pages'
+            step = int(args[0]) * (window if args[1] == 'pages' else 1)
+            start = self._view_start + step
+        self._view_start = max(0, min(start, max(0, total - window)))
+        self._refresh_visible()
+
+    def _refresh_visible(self):
+        """Materialize only the rows inside the virtual window
+
+        Inserting every result made the widget O(total rows); with the
+        window, scrolling and appends touch at most _VISIBLE_ROWS items
+        regardless of file size.
+        """
+        tree = self.formatted_output
+        cache = self._row_cache
+        total = len(cache)
+        lo = min(self._view_start, max(0, total - self._VISIBLE_ROWS))
+        hi = min(total, lo + self._VISIBLE_ROWS)
+
+        existing = set(tree.get_children())
+        wanted = [str(i) for i in range(lo, hi)]
+
+        # Blank displaycolumns while the window is rewritten so Tk does
+        # one layout pass on restore instead of one per insert/move
+        tree.configure(displaycolumns=())
+        try:
+            for iid in existing.difference(wanted):
+                tree.delete(iid)
+            for pos, iid in enumerate(wanted):
+                if iid in existing:
+                    tree.move(iid, '', pos)
+                else:
+                    tree.insert('', pos, iid=iid, values=cache[int(iid)])
+        finally:
+            tree.configure(displaycolumns=self.tree_columns)
+
+        # The scrollbar reflects the position within the whole result
+        # set, not the materialized window
+        if total:
+            self._tree_scrollbar.set(lo / total, hi / total)
 
     def show_details(self):
         """Show detailed information about the analyzed word"""
-        if not hasattr(self, 'last_result') or not self.last_result:
+        if not getattr(self, 'last_result', None):
             messagebox.showinfo("Info", "No analysis results available")
             return
-            
-        # Get the full analysis from stored results
-        analysis = self.last_result[0]  # Since we're only analyzing one word
+
+        # The detail text is rendered eagerly by analyze_text; rebuild
+        # only if something else replaced last_result
+        if self._detail_text is None:
+            self._detail_text = self._render_details(self.last_result[0])
+
+        # Reuse one Toplevel across clicks: refilling the Text widget is
+        # far cheaper than constructing the window every time
+        window = self._detail_window
+        if window is None or not window.winfo_exists():
+            window = tk.Toplevel(self.root)
+            window.title("Detailed Analysis")
+            window.geometry("450x400")
+            widget = scrolledtext.ScrolledText(window, wrap=WORD,
+                                               padx=10, pady=10)
+            widget.pack(fill=BOTH, expand=True)
+            # Closing hides the window so the next click can re-show it
+            window.protocol("WM_DELETE_WINDOW", window.withdraw)
+            self._detail_window = window
+            self._detail_widget = widget
+
+        widget = self._detail_widget
+        widget.configure(state=NORMAL)
+        widget.delete('1.0', END)
+        widget.insert('1.0', self._detail_text)
+        widget.configure(state=DISABLED)
+        window.deiconify()
+        window.lift()
+
+    def _render_details(self, analysis):
+        """Render the detail text for one analysis"""
+        # Hoist the repeatedly-read fields; each analysis[...] is a dict
+        # probe and these are hit up to four times below
         word = analysis['original']
-        
-        details = f"Detailed Analysis for '{word}'\n\n"
-        details += f"Root Word: {analysis['root']}\n"
-        
-        if 'root_info' in analysis and analysis['root_info']:
-            if analysis['root_info'].get('meaning'):
-                details += f"Meaning: {analysis['root_info']['meaning']}\n"
-            if analysis['root_info'].get('category'):
-                details += f"Category: {analysis['root_info']['category']}\n"
-        
-        if analysis.get('prefix', ''):
-            details += f"\nPrefix Information:\n"
-            details += "\n".join([f"{k}: {v}" for k, v in analysis['prefix_features'].items()])
-        
-        if analysis.get('suffix', ''):
-            details += f"\n\nSuffix Information:\n"
-            details += "\n".join([f"{k}: {v}" for k, v in analysis['suffix_features'].items()])
-        
+        root = analysis['root']
+        prefix = analysis.get('prefix', '')
+        suffix = analysis.get('suffix', '')
+
+        # Collect fragments and join once; += on str reallocates the
+        # whole buffer per append
+        parts = [f"Detailed Analysis for '{word}'\n\n",
+                 f"Root Word: {root}\n"]
+
+        root_info = analysis.get('root_info')
+        if root_info:
+            if root_info.get('meaning'):
+                parts.append(f"Meaning: {root_info['meaning']}\n")
+            if root_info.get('category'):
+                parts.append(f"Category: {root_info['category']}\n")
+
+        if prefix:
+            parts.append("\nPrefix Information:\n")
+            parts.append("\n".join(f"{k}: {v}" for k, v in analysis['prefix_features'].items()))
+
+        if suffix:
+            parts.append("\n\nSuffix Information:\n")
+            parts.append("\n".join(f"{k}: {v}" for k, v in analysis['suffix_features'].items()))
+
         # Enhanced sandhi information
         if analysis.get('sandhi_applied'):
-            details += f"\n\nSandhi Applied: Yes"
-            # Get sandhi rules from the analyzer
-            sandhi_rules = self.analyzer.sandhi_rules if hasattr(self.analyzer, 'sandhi_rules') else {}
-            
+            parts.append("\n\nSandhi Applied: Yes")
+            # Sandhi rules were resolved once in initialize_analyzer
+            sandhi_rules = self._sandhi_rules
+
             # Display information about prefix-root junction if applicable
-            if analysis.get('prefix') and analysis.get('root'):
-                junction = f"{analysis['prefix'][-1]}+{analysis['root'][0]}"
+            if prefix and root:
+                junction = f"{prefix[-1]}+{root[0]}"
                 # Check if the junction is in the sandhi rules
                 if junction in sandhi_rules:
-                    details += f"\n\nPrefix-Root Junction: {analysis['prefix']} + {analysis['root']}"
-                    details += f"\nSandhi Rule Applied: {junction} → {sandhi_rules[junction]}"
-                    # details += f"\nExample: {analysis['prefix'][:-1]}{sandhi_rules[junction]}{analysis['root'][1:]}"
-                
+                    parts.append(f"\n\nPrefix-Root Junction: {prefix} + {root}")
+                    parts.append(f"\nSandhi Rule Applied: {junction} → {sandhi_rules[junction]}")
+
             # Display information about root-suffix junction if applicable
-            if analysis.get('root') and analysis.get('suffix'):
-                junction = f"{analysis['root'][-1]}+{analysis['suffix'][0]}"
+            if root and suffix:
+                junction = f"{root[-1]}+{suffix[0]}"
                 if junction in sandhi_rules:
-                    details += f"\n\nRoot-Suffix Junction: {analysis['root']} + {analysis['suffix']}"
-                    details += f"\nSandhi Rule Applied: {junction} → {sandhi_rules[junction]}"
-                    # details += f"\nExample: {analysis['root'][:-1]}{sandhi_rules[junction]}{analysis['suffix'][1:]}"
-        
-        messagebox.showinfo("Detailed Analysis", details)
+                    parts.append(f"\n\nRoot-Suffix Junction: {root} + {suffix}")
+                    parts.append(f"\nSandhi Rule Applied: {junction} → {sandhi_rules[junction]}")
+
+        return "".join(parts)
 
     def create_statusbar(self):
         """Create status bar at the bottom of the window"""
-        self.status_var = tk.StringVar()
         self.status_var.set("Ready")
-        
-        status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=SUNKEN, anchor=W)
+        status_bar.pack(side=BOTTOM, fill=X)
     
     def load_sample(self, sample_text):
-        """Load a sample text into the input area"""
-        self.input_text.delete(0, tk.END)
+        """Load a sample text into the input area; if a precomputed
+        analysis exists, display it immediately"""
+        self.input_text.delete(0, END)
         self.input_text.insert(0, sample_text)
+
+        cached = self._sample_cache.get(sample_text)
+        if cached is not None:
+            result = [cached]
+            self.last_result = result
+            self._detail_text = None  # Re-rendered on demand
+            self.display_results(result)
+            self.status_var.set(f"Loaded sample text: {sample_text}")
+            return
+
         self.status_var.set(f"Loaded sample text: {sample_text}")
     
     def clear_input(self):
         """Clear the input text area"""
-        self.input_text.delete(0, tk.END)
+        self.input_text.delete(0, END)
         self.result_word_var.set("")
         self.result_root_var.set("")
         self.result_prefix_var.set("")
@@ -243,26 +661,47 @@ class HindiMorphGUI:
     
     def analyze_text(self):
         """Analyze the input word and display results"""
-        input_word = self.input_text.get().strip()
+        # strip() always copies; only pay for it when there is actual
+        # whitespace to trim
+        raw = self.input_text.get()
+        if raw and not (raw[0].isspace() or raw[-1].isspace()):
+            input_word = raw
+        else:
+            input_word = raw.strip()
         if not input_word:
             messagebox.showwarning("No Input", "Please enter a Hindi word to analyze.")
             return
-        
+
+        # Run the analysis on the executor so the Tk event loop never
+        # blocks; the done-callback marshals back via root.after. The
+        # worker also absorbs the wait if the analyzer is still loading.
+        self.analyze_btn.configure(state=DISABLED)
+        self.status_var.set("Analyzing word...")
+        future = self._executor.submit(self._run_analysis, input_word)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_analysis_done, f))
+
+    def _run_analysis(self, input_word):
+        """Worker-thread analysis; repeats land in the lru_cache"""
+        _ = self.analyzer  # Blocks until the background load finishes
+        return [self._analyze_one(input_word)]
+
+    def _on_analysis_done(self, future):
+        """Tk-thread completion callback: display the worker's result"""
+        self.analyze_btn.configure(state=NORMAL)
         try:
-            self.status_var.set("Analyzing word...")
-            self.root.update_idletasks()
-            
-            # Analyze single word
-            result = [self.analyzer.analyze(input_word)]
-            self.last_result = result  # Store for details view
-            
-            # Display results
-            self.display_results(result)
-            self.status_var.set("Analysis complete")
-        
+            result = future.result()
         except Exception as e:
             messagebox.showerror("Analysis Error", f"Error analyzing word: {str(e)}")
             self.status_var.set("Analysis failed")
+            return
+
+        self.last_result = result  # Store for details view
+
+        # Display results and pre-render the detail view for it
+        self.display_results(result)
+        self._detail_text = self._render_details(result[0])
+        self.status_var.set("Analysis complete")
 
     def display_results(self, results):
         """Display analysis results using StringVar variables"""
@@ -290,11 +729,41 @@ class HindiMorphGUI:
         
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    text = file.read()
-                
-                self.input_text.delete(0, tk.END)
-                self.input_text.insert(0, text)
+                # Stat before reading: files over 1 MB are streamed by the
+                # worker, only a short preview lands in the Entry widget
+                if os.path.getsize(file_path) > (1 << 20):
+                    with open(file_path, 'r', encoding='utf-8',
+                              errors='replace') as file:
+                        preview = file.read(4096)
+
+                    self.input_text.delete(0, END)
+                    self.input_text.insert(0, preview)
+
+                    self._reset_batch_table()
+                    self._batch_id += 1
+                    threading.Thread(target=self._batch_analyze_file,
+                                     args=(file_path, self._batch_id),
+                                     daemon=True).start()
+                    self._start_drain()
+                else:
+                    with open(file_path, 'r', encoding='utf-8',
+                              errors='replace') as file:
+                        text = file.read()
+
+                    self.input_text.delete(0, END)
+                    self.input_text.insert(0, text)
+
+                    # Analyze the file contents off the Tk thread; results
+                    # stream into the batch table as they arrive
+                    words = re.findall(r'\S+', text)
+                    if words:
+                        self._reset_batch_table()
+                        self._batch_id += 1
+                        threading.Thread(target=self._batch_analyze,
+                                         args=(words, self._batch_id),
+                                         daemon=True).start()
+                        self._start_drain()
+
                 self.status_var.set(f"Loaded file: {os.path.basename(file_path)}")
             
             except Exception as e:
@@ -302,21 +771,40 @@ class HindiMorphGUI:
     
     def save_results(self):
         """Save analysis results to a file"""
+        # A finished file analysis takes precedence over the last single
+        # word; either way the serialization below streams
+        results = self._results or getattr(self, 'last_result', None)
+        if not results:
+            messagebox.showinfo("Info", "No analysis results available")
+            return
+
         file_path = filedialog.asksaveasfilename(
             title="Save Results",
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("Text files", "*.txt"), ("All files", "*.*")]
         )
-        
+
         if file_path:
             try:
-                raw_output = self.raw_output.get(1.0, tk.END).strip()
-                
+                from hindi_morph_analyzer import results_to_dicts
+
+                # iterencode + chunked writes keep memory flat for large
+                # batch results instead of building one giant string
+                encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
                 with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(raw_output)
-                
+                    buf = []
+                    buffered = 0
+                    for chunk in encoder.iterencode(results_to_dicts(results)):
+                        buf.append(chunk)
+                        buffered += len(chunk)
+                        if buffered >= 65536:
+                            file.write(''.join(buf))
+                            buf.clear()
+                            buffered = 0
+                    file.write(''.join(buf))
+
                 self.status_var.set(f"Results saved to: {os.path.basename(file_path)}")
-            
+
             except Exception as e:
                 messagebox.showerror("Save Error", f"Error saving results: {str(e)}")
     
@@ -331,6 +819,9 @@ class HindiMorphGUI:
         if file_path:
             try:
                 self.analyzer.load_rules(file_path)
+                self._analyze_one.cache_clear()
+                self._sample_cache = {}
+                self._refresh_sample_cache()
                 self.rules_path = file_path
                 self.status_var.set(f"Rules loaded from: {os.path.basename(file_path)}")
             
@@ -348,6 +839,9 @@ class HindiMorphGUI:
         if file_path:
             try:
                 self.analyzer.load_dictionary(file_path)
+                self._analyze_one.cache_clear()
+                self._sample_cache = {}
+                self._refresh_sample_cache()
                 self.dict_path = file_path
                 self.status_var.set(f"Dictionary loaded from: {os.path.basename(file_path)}")
             
@@ -6,10 +6,15 @@ Hindi Morphology Analyzer CLI
 A command-line interface for the Hindi Morphology Analyzer
 """
 
+import io
 import os
+import sys
+import time
 import argparse
 import json
-from hindi_morph_analyzer import HindiMorphAnalyzer, create_test_dataset, evaluate_analyzer
+from hindi_morph_analyzer import (
+    HindiMorphAnalyzer, create_test_dataset, evaluate_analyzer, results_to_dicts
+)
 
 def setup_argument_parser():
     """Set up command line argument parser"""
@@ -32,8 +37,16 @@ def setup_argument_parser():
     eval_parser.add_argument('--rules', help='Path to rules file (JSON)')
     eval_parser.add_argument('--dict', help='Path to dictionary file (JSON)')
     eval_parser.add_argument('--test-data', help='Path to test data file (JSON)')
+    eval_parser.add_argument('--synthesize', action='store_true',
+                           help='Fall back to a generated dataset if --test-data is missing')
     eval_parser.add_argument('--out', help='Output file path for evaluation results (JSON)')
     
+    # REPL command: load the analyzer once and stream lines from stdin,
+    # amortizing the rules/dictionary load across the whole batch
+    repl_parser = subparsers.add_parser('repl', help='Analyze lines from stdin, one JSON array per line')
+    repl_parser.add_argument('--rules', help='Path to rules file (JSON)')
+    repl_parser.add_argument('--dict', help='Path to dictionary file (JSON)')
+
     # Create test data command
     testdata_parser = subparsers.add_parser('create-test-data', help='Create sample test data')
     testdata_parser.add_argument('--size', type=int, default=100, help='Number of test items to create')
@@ -49,45 +62,74 @@ def analyze_input(args):
         dictionary_path=args.dict
     )
     
-    # Check if input is a single word or text
-    if ' ' in args.input:
-        results = analyzer.process_text(args.input)
+    # Split once and reuse the token list; process_text would re-scan
+    # the string to tokenize it again
+    tokens = args.input.split()
+    if len(tokens) == 1:
+        results = [analyzer.analyze(tokens[0])]
     else:
-        results = [analyzer.analyze(args.input)]
+        # Analyze each distinct surface form once and expand back in
+        # input order; auxiliaries and particles repeat heavily in real
+        # text. Punctuation-only tokens yield [] and drop out, exactly
+        # as they would from process_text_tokens.
+        uniq = dict.fromkeys(tokens)
+        per = {token: analyzer.process_text_tokens([token]) for token in uniq}
+        results = [result for token in tokens for result in per[token]]
     
     # Output results
     if args.format == 'json':
-        output = json.dumps(results, ensure_ascii=False, indent=2)
+        output = json.dumps(results_to_dicts(results), ensure_ascii=False, indent=2)
         if args.out:
             with open(args.out, 'w', encoding='utf-8') as f:
                 f.write(output)
         else:
             print(output)
     else:  # text format
-        output_text = ""
+        # StringIO keeps the report build linear; += on str recopies the
+        # whole buffer every line
+        buf = io.StringIO()
+        write = buf.write
         for idx, result in enumerate(results):
-            output_text += f"Analysis {idx+1}: {result['original']}\n"
-            output_text += f"  Root: {result['root']}\n"
-            output_text += f"  Category: {result['root_info'].get('category', 'unknown')}\n"
-            
+            write(f"Analysis {idx+1}: {result['original']}\n")
+            write(f"  Root: {result['root']}\n")
+            write(f"  Category: {result['root_info'].get('category', 'unknown')}\n")
+
             if result['suffix']:
-                output_text += f"  Suffix: {result['suffix']}\n"
+                write(f"  Suffix: {result['suffix']}\n")
                 features = ", ".join([f"{k}: {v}" for k, v in result['suffix_features'].items()])
-                output_text += f"  Features: {features}\n"
-            
+                write(f"  Features: {features}\n")
+
             if result['prefix']:
-                output_text += f"  Prefix: {result['prefix']}\n"
+                write(f"  Prefix: {result['prefix']}\n")
                 prefix_info = ", ".join([f"{k}: {v}" for k, v in result['prefix_features'].items()])
-                output_text += f"  Prefix Info: {prefix_info}\n"
-            
-            output_text += "\n"
-        
+                write(f"  Prefix Info: {prefix_info}\n")
+
+            write("\n")
+
+        output_text = buf.getvalue()
+
         if args.out:
             with open(args.out, 'w', encoding='utf-8') as f:
                 f.write(output_text)
         else:
             print(output_text)
 
+def repl(args):
+    """Analyze stdin lines against one long-lived analyzer instance"""
+    analyzer = HindiMorphAnalyzer(
+        rules_path=args.rules,
+        dictionary_path=args.dict
+    )
+
+    write = sys.stdout.write
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        results = analyzer.process_text(line)
+        write(json.dumps(results_to_dicts(results), ensure_ascii=False) + '\n')
+        sys.stdout.flush()
+
 def evaluate_analyzer_cli(args):
     """Evaluate analyzer against test data"""
     # Initialize analyzer
@@ -96,15 +138,23 @@ def evaluate_analyzer_cli(args):
         dictionary_path=args.dict
     )
     
-    # Load test data or create default
-    if args.test_data and os.path.exists(args.test_data):
-        with open(args.test_data, 'r', encoding='utf-8') as f:
-            test_data = json.load(f)
+    # Load test data; a mistyped path fails fast instead of silently
+    # evaluating against a freshly generated synthetic dataset
+    if args.test_data:
+        if os.path.exists(args.test_data):
+            with open(args.test_data, 'r', encoding='utf-8') as f:
+                test_data = json.load(f)
+        elif args.synthesize:
+            test_data = create_test_dataset()
+        else:
+            raise SystemExit(f"test-data not found: {args.test_data}")
     else:
         test_data = create_test_dataset()
-    
-    # Run evaluation
+
+    # Run evaluation, timed so optimization work is measurable
+    start_time = time.perf_counter()
     metrics = evaluate_analyzer(analyzer, test_data)
+    print(f"eval_time={time.perf_counter() - start_time:.3f}s")
     
     # Output results
     output = json.dumps(metrics, ensure_ascii=False, indent=2)
@@ -135,6 +185,8 @@ def main():
     
     if args.command == 'analyze':
         analyze_input(args)
+    elif args.command == 'repl':
+        repl(args)
     elif args.command == 'evaluate':
         evaluate_analyzer_cli(args)
     elif args.command == 'create-test-data':
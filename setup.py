@@ -0,0 +1,14 @@
+# Optional build script for the compiled analyzer kernels.
+# The analyzer works without this; building the extension just makes the
+# hot affix-extraction loops run at C speed:
+#
+#     pip install cython
+#     python setup.py build_ext --inplace
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='hindi-morphology-analyzer',
+    ext_modules=cythonize('hindi_morph_core.pyx'),
+)
@@ -1,116 +1,185 @@
-import json
-import re
-
-def parse_wordnet_line(line):
-    # Split by | to separate definition and example
-    parts = line.split('|')
-    if len(parts) < 2:
-        return None
-        
-    # Parse the first part to get synset info
-    synset_part = parts[0].strip().split()
-    if len(synset_part) < 4:
-        return None
-        
-    # Get synonyms
-    synonyms = synset_part[3].split(':')
-    
-    # Get definition
-    definition = parts[1].split(':')[0].strip()
-    
-    # Get examples if present
-    examples = []
-    if ':' in parts[1]:
-        example = parts[1].split(':')[1].strip().strip('"')
-        if example:
-            examples.append(example)
-            
-    # Get category info from codes
-    category = 'noun'
-    if synset_part[1] == '02':
-        category = 'adjective'
-    elif synset_part[1] == '03':
-        category = 'verb'
-    elif synset_part[1] == '04':
-        category = 'adverb'
-        
-    return {
-        'word': synonyms[0],
-        'synonyms': synonyms[1:],
-        'category': category,
-        'meaning': definition,
-        'example': examples[0] if examples else None,
-    }
-
-def get_root_word(word):
-    """Extract root word by removing both prefixes and suffixes"""
-    # Common Hindi prefixes to remove
-    prefixes = [
-        'अ', 'अन', 'अधि', 'अनु', 'अभि', 'अव', 'आ', 'उप', 'उत्', 
-        'दुर्', 'दु', 'निर्', 'नि', 'पर', 'परि', 'प्र', 'प्रति', 
-        'सु', 'स', 'सम्', 'सह'
-    ]
-    
-    # Sort prefixes by length (longest first)
-    prefixes.sort(key=len, reverse=True)
-    
-    # Remove prefix if present
-    root = word
-    original_root = root  # Store original word
-    
-    for prefix in prefixes:
-        if word.startswith(prefix):
-            root = word[len(prefix):]
-            # If removing prefix results in empty string, keep original
-            if not root.strip():
-                root = original_root
-            break
-    
-    # Remove suffix inflections
-    stripped_root = root.rstrip('ाीेैोौंः')
-    
-    # If stripping everything results in empty string, return original root
-    return stripped_root if stripped_root.strip() else root
-
-def convert_to_dictionary_format():
-    dictionary = {}
-    
-    with open('HindiWN_1_5/database/data_txt', 'r', encoding='utf-8') as f:
-        for line in f:
-            entry = parse_wordnet_line(line)
-            if entry and entry['word'].strip():  # Check for non-empty words
-                # Get root word by removing both prefix and suffix
-                root = get_root_word(entry['word'])
-                
-                # Skip entries where root extraction failed
-                if not root.strip():
-                    continue
-                    
-                if root not in dictionary:
-                    dictionary[root] = {
-                        'category': entry['category'],
-                        'meaning': entry['meaning'],
-                        'gender': 'masculine' if entry['word'].endswith('ा') else 'feminine',
-                        'example': entry['example'],
-                        'base_forms': [entry['word']],
-                        'synonyms': entry['synonyms']
-                        # 'original_word': entry['word']  # Store original word for reference
-                    }
-                else:
-                    # If root exists, add the word to base forms if not already present
-                    if entry['word'] not in dictionary[root]['base_forms']:
-                        dictionary[root]['base_forms'].append(entry['word'])
-                    # Add new synonyms if not already present
-                    dictionary[root]['synonyms'].extend(
-                        [syn for syn in entry['synonyms'] 
-                         if syn not in dictionary[root]['synonyms']]
-                    )
-                    
-    return dictionary
-
-# Generate enhanced dictionary
-dictionary = convert_to_dictionary_format()
-
-# Save to JSON file
-with open('enhanced_hindi_dictionary_v2.json', 'w', encoding='utf-8') as f:
-    json.dump(dictionary, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+import json
+import mmap
+import os
+import re
+
+# pandas pushes the per-line tokenization into C; the pure-Python
+# parser below remains the fallback when it isn't installed
+try:
+    import pandas as _pd
+except ImportError:
+    _pd = None
+
+# orjson's C encoder writes the output dictionary far faster than the
+# stdlib; optional, same as in hindi_morph_analyzer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One compiled pass replaces the six Python-level splits per line; the
+# groups are synset id, category code, synonym list, definition, example
+_WN_RE = re.compile(
+    r'^\s*(\S+)\s+(\S+)\s+\S+\s+(\S+)\s*\|\s*([^:]+?)(?::\s*"?([^"]*)"?)?\s*$')
+
+_CAT = {'02': 'adjective', '03': 'verb', '04': 'adverb'}
+
+def parse_wordnet_line(line):
+    match = _WN_RE.match(line)
+    if match is None:
+        return None
+
+    # Get synonyms
+    synonyms = match.group(3).split(':')
+
+    # Get example if present
+    example = (match.group(5) or '').strip()
+
+    return {
+        'word': synonyms[0],
+        'synonyms': synonyms[1:],
+        'category': _CAT.get(match.group(2), 'noun'),
+        'meaning': match.group(4).strip(),
+        'example': example or None,
+    }
+
+# Common Hindi prefixes to remove, longest first so compound prefixes
+# win; built once at module load instead of per get_root_word call
+_PREFIXES = tuple(sorted([
+    'अ', 'अन', 'अधि', 'अनु', 'अभि', 'अव', 'आ', 'उप', 'उत्',
+    'दुर्', 'दु', 'निर्', 'नि', 'पर', 'परि', 'प्र', 'प्रति',
+    'सु', 'स', 'सम्', 'सह'
+], key=len, reverse=True))
+
+# One anchored alternation replaces the startswith loop; longest-first
+# ordering makes the regex engine honour compound prefixes
+_PREFIX_RE = re.compile(r'^(?:' + '|'.join(map(re.escape, _PREFIXES)) + r')')
+
+# Vowel signs and nasalization marks stripped from the right edge;
+# membership on ord() codepoints beats rstrip's per-char set rescans
+_SUFFIX_CP = frozenset(map(ord, 'ाीेैोौंः'))
+
+def get_root_word(word):
+    """Extract root word by removing both prefixes and suffixes"""
+    # Remove prefix if present; keep the original when stripping would
+    # leave nothing
+    match = _PREFIX_RE.match(word)
+    root = word
+    if match:
+        remainder = word[match.end():]
+        if remainder.strip():
+            root = remainder
+
+    # Remove suffix inflections: walk back over trailing vowel marks and
+    # slice once
+    i = len(root)
+    while i and ord(root[i - 1]) in _SUFFIX_CP:
+        i -= 1
+
+    # If stripping everything results in empty string, return original root
+    return root[:i] if i else root
+
+def _parse_entries_pandas(path):
+    """Parse the WordNet dump with vectorized pandas string operations
+
+    read_csv's C engine does the '|' split and the .str accessors
+    tokenize whole columns at once, replacing the per-line Python
+    splits in parse_wordnet_line.
+    """
+    import csv
+
+    df = _pd.read_csv(path, sep='|', header=None, names=['syn', 'defex'],
+                      engine='c', quoting=csv.QUOTE_NONE, encoding='utf-8',
+                      dtype=str, on_bad_lines='skip')
+    df = df.dropna()
+
+    syn = df['syn'].str.strip().str.split(n=3, expand=True)
+    if syn.shape[1] < 4:
+        return
+    # Lines with fewer than four synset fields are malformed
+    keep = syn[3].notna()
+    syn = syn[keep]
+    defex = df.loc[keep, 'defex'].str.split(':', n=1, expand=True)
+
+    synonyms = syn[3].str.split(':')
+    categories = syn[1].map({'02': 'adjective', '03': 'verb',
+                             '04': 'adverb'}).fillna('noun')
+    definitions = defex[0].str.strip()
+    if defex.shape[1] > 1:
+        examples = defex[1].fillna('').str.strip().str.strip('"')
+    else:
+        examples = _pd.Series('', index=defex.index)
+
+    for syns, category, meaning, example in zip(
+            synonyms, categories, definitions, examples):
+        yield {
+            'word': syns[0],
+            'synonyms': syns[1:],
+            'category': category,
+            'meaning': meaning,
+            'example': example or None,
+        }
+
+def convert_to_dictionary_format():
+    path = 'HindiWN_1_5/database/data_txt'
+    if _pd is not None:
+        return _build_dictionary(_parse_entries_pandas(path))
+    if os.path.getsize(path) == 0:
+        return {}
+    # Memory-map the dump and decode per line: the kernel handles the
+    # readahead and the TextIOWrapper buffering layer drops out
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _build_dictionary(
+                parse_wordnet_line(raw.decode('utf-8'))
+                for raw in iter(mm.readline, b''))
+
+def _build_dictionary(entries):
+    dictionary = {}
+
+    for entry in entries:
+        if entry and entry['word'].strip():  # Check for non-empty words
+            # Get root word by removing both prefix and suffix
+            root = get_root_word(entry['word'])
+            
+            # Skip entries where root extraction failed
+            if not root.strip():
+                continue
+                
+            record = dictionary.get(root)
+            if record is None:
+                # base_forms/synonyms accumulate as sets: membership is a
+                # hash probe instead of a list scan that grows with every
+                # inflected form a popular root collects
+                dictionary[root] = {
+                    'category': entry['category'],
+                    'meaning': entry['meaning'],
+                    'gender': 'masculine' if entry['word'].endswith('ा') else 'feminine',
+                    'example': entry['example'],
+                    'base_forms': {entry['word']},
+                    'synonyms': set(entry['synonyms'])
+                }
+            else:
+                record['base_forms'].add(entry['word'])
+                record['synonyms'].update(entry['synonyms'])
+
+    # Materialize the sets as sorted lists for the JSON dump
+    for record in dictionary.values():
+        record['base_forms'] = sorted(record['base_forms'])
+        record['synonyms'] = sorted(record['synonyms'])
+
+    return dictionary
+
+if __name__ == '__main__':
+    # Generate enhanced dictionary
+    dictionary = convert_to_dictionary_format()
+
+    # Save to JSON file. The output is machine-consumed by the analyzer,
+    # so it is written compact: indent forces the stdlib encoder onto
+    # its slow path and roughly triples the file size
+    if orjson is not None:
+        with open('enhanced_hindi_dictionary_v2.json', 'wb') as f:
+            f.write(orjson.dumps(dictionary, option=orjson.OPT_APPEND_NEWLINE))
+    else:
+        with open('enhanced_hindi_dictionary_v2.json', 'w', encoding='utf-8') as f:
+            json.dump(dictionary, f, ensure_ascii=False, separators=(',', ':'))
\ No newline at end of file